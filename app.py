@@ -20,7 +20,7 @@ from mt5_connector import MT5Connector
 from trading_manager import TradingManager
 from utils.logger import setup_logger
 from utils.validators import validate_webhook_payload, validate_api_key
-from utils.exceptions import MT5Error, ConfigError, ValidationError
+from utils.exceptions import MT5Error, ConfigError, ValidationError, ConnectionError
 from utils.chinese_parser import parse_chinese_message
 
 # Initialize Flask app
@@ -48,9 +48,7 @@ def initialize_app():
         logger.info("Starting MT5 Trading HTTP Server...")
 
         # Initialize MT5 connector (使用当前已登录的MT5)
-        mt5_connector = MT5Connector(config['mt5'])
-        if not mt5_connector.connect():
-            raise MT5Error("Failed to connect to MT5 terminal")
+        mt5_connector = MT5Connector.get_shared(config['mt5'])
 
         # Initialize trading manager
         trading_config = config['trading'].copy()
@@ -72,12 +70,14 @@ def initialize_app():
 def health_check():
     """Health check endpoint."""
     try:
-        mt5_status = mt5_connector.is_connected() if mt5_connector else False
-
-        # Get account info
+        # One account info read serves as both the connection probe and the payload
         account_info = None
-        if mt5_connector and mt5_status:
-            account_info = mt5_connector.get_account_info()
+        if mt5_connector:
+            try:
+                account_info = mt5_connector.get_account_info()
+            except ConnectionError:
+                account_info = None
+        mt5_status = account_info is not None
 
         return jsonify({
             'status': 'healthy' if mt5_status else 'unhealthy',
@@ -95,7 +95,7 @@ def get_status():
     """Get detailed server status."""
     try:
         # Validate API key if required
-        if not validate_api_key(request, config_manager.get_config()['server'].get('security', {})):
+        if not validate_api_key(request, config_manager.get_value('server', 'security', {})):
             return jsonify({'error': 'Invalid API key'}), 401
 
         # Get account info
@@ -117,7 +117,7 @@ def get_positions():
     """Get current positions."""
     try:
         # Validate API key if required
-        if not validate_api_key(request, config_manager.get_config()['server'].get('security', {})):
+        if not validate_api_key(request, config_manager.get_value('server', 'security', {})):
             return jsonify({'error': 'Invalid API key'}), 401
 
         positions = trading_manager.get_positions() if trading_manager else []
@@ -138,7 +138,7 @@ def webhook():
     """Handle TradingView webhook requests."""
     try:
         # Validate API key if required
-        if not validate_api_key(request, config_manager.get_config()['server'].get('security', {})):
+        if not validate_api_key(request, config_manager.get_value('server', 'security', {})):
             return jsonify({'error': 'Invalid API key'}), 401
         
         # Get request data - support both JSON and plain text
@@ -191,7 +191,7 @@ def webhook():
                 return jsonify({'error': f'中文消息解析错误: {str(e)}'}), 400
 
         # Validate webhook payload
-        validation_result = validate_webhook_payload(payload, config_manager.get_config()['webhook'])
+        validation_result = validate_webhook_payload(payload, config_manager.get_section('webhook'))
         if not validation_result['valid']:
             return jsonify({'error': validation_result['message']}), 400
 
@@ -235,7 +235,7 @@ def manual_trade():
     """Manual trade endpoint for testing."""
     try:
         # Validate API key if required
-        if not validate_api_key(request, config_manager.get_config()['server'].get('security', {})):
+        if not validate_api_key(request, config_manager.get_value('server', 'security', {})):
             return jsonify({'error': 'Invalid API key'}), 401
 
         payload = request.get_json()
@@ -293,8 +293,7 @@ def main():
     except Exception as e:
         logger.error(f"Server error: {e}")
     finally:
-        if mt5_connector:
-            mt5_connector.disconnect()
+        MT5Connector.close_all()
         logger.info("Server shutdown complete")
 
 
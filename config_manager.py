@@ -9,6 +9,9 @@ import logging
 from typing import Dict, Any, Optional
 from utils.exceptions import ConfigError
 
+REQUIRED_SECTIONS = ('mt5', 'server', 'trading', 'logging', 'webhook')
+VALID_LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+
 
 class ConfigManager:
     """Manages application configuration."""
@@ -44,9 +47,7 @@ class ConfigManager:
     
     def _validate_config(self) -> None:
         """Validate configuration structure and values."""
-        required_sections = ['mt5', 'server', 'trading', 'logging', 'webhook']
-        
-        for section in required_sections:
+        for section in REQUIRED_SECTIONS:
             if section not in self.config:
                 raise ConfigError(f"Missing required configuration section: {section}")
         
@@ -139,9 +140,8 @@ class ConfigManager:
         # Validate log level
         if 'level' in logging_config:
             level = logging_config['level']
-            valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-            if level not in valid_levels:
-                raise ConfigError(f"Invalid log level: {level}. Must be one of {valid_levels}")
+            if level not in VALID_LOG_LEVELS:
+                raise ConfigError(f"Invalid log level: {level}. Must be one of {VALID_LOG_LEVELS}")
         
         # Validate numeric settings
         numeric_fields = ['max_size', 'backup_count']
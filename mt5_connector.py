@@ -3,49 +3,146 @@ MT5 Connector for MT5 Trading HTTP Server.
 Handles connection and communication with MetaTrader 5 terminal.
 """
 
-import MetaTrader5 as mt5
 import logging
+import operator
+import re
+import time
+import threading
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from functools import wraps
+from mt5_models import Position, Order, AccountInfo
 from utils.exceptions import MT5Error, ConnectionError
 from utils.logger import log_mt5_connection, log_error_with_context
 
+_mt5 = None
+
+# Matches error messages that indicate a lost terminal connection
+CONNECTION_ERROR_PATTERN = re.compile(r'not connected|connection', re.IGNORECASE)
+
+# Column layout for get_positions_columnar()
+POSITION_COLUMNS = (
+    ('ticket', np.int64),
+    ('symbol', object),
+    ('type', np.int64),
+    ('volume', np.float64),
+    ('price_open', np.float64),
+    ('price_current', np.float64),
+    ('sl', np.float64),
+    ('tp', np.float64),
+    ('profit', np.float64),
+    ('swap', np.float64),
+    ('comment', object),
+    ('magic', np.int64),
+    ('time', np.int64),
+    ('time_update', np.int64),
+    ('external_id', object),
+    ('identifier', np.int64),
+    ('reason', np.int64),
+    ('time_msc', np.int64),
+    ('time_update_msc', np.int64),
+)
+
+# Column layout for get_orders_columnar()
+ORDER_COLUMNS = (
+    ('ticket', np.int64),
+    ('symbol', object),
+    ('type', np.int64),
+    ('volume_initial', np.float64),
+    ('volume_current', np.float64),
+    ('price_open', np.float64),
+    ('sl', np.float64),
+    ('tp', np.float64),
+    ('comment', object),
+    ('magic', np.int64),
+    ('time_setup', np.int64),
+    ('time_expiration', np.int64),
+)
+
+# Delay before the next connect attempt after a failure, doubled on each
+# consecutive failure up to the maximum (seconds)
+RECONNECT_BACKOFF_INITIAL = 0.1
+RECONNECT_BACKOFF_MAX = 5.0
+
+# Field names and C-level getters used to build the row dictionaries
+POSITION_FIELDS = tuple(name for name, _ in POSITION_COLUMNS)
+ORDER_FIELDS = tuple(name for name, _ in ORDER_COLUMNS)
+_get_position_fields = operator.attrgetter(*POSITION_FIELDS)
+_get_order_fields = operator.attrgetter(*ORDER_FIELDS)
+
+
+def load_mt5():
+    """
+    Import the MetaTrader5 package on first use.
+
+    Deferring the import keeps the native library out of module import time.
+
+    Returns:
+        The MetaTrader5 module
+    """
+    global _mt5
+    if _mt5 is None:
+        import MetaTrader5
+        _mt5 = MetaTrader5
+    return _mt5
+
+
+def _build_columns(rows, columns) -> Dict[str, np.ndarray]:
+    """
+    Transpose MT5 records into one array per field.
+
+    Args:
+        rows: Sequence of MT5 named tuples
+        columns: (field name, dtype) pairs
+
+    Returns:
+        Dictionary mapping field name to array
+    """
+    count = len(rows)
+    return {
+        name: np.fromiter((getattr(row, name) for row in rows), dtype=dtype, count=count)
+        for name, dtype in columns
+    }
+
 
 def auto_reconnect(func):
     """
     Decorator to automatically reconnect to MT5 if connection is lost.
+
+    The decorated method is called straight away; its own connection check
+    raises ConnectionError when the terminal is gone, which triggers the
+    reconnect-and-retry path below.
     """
+    fname = func.__name__
+    lost_msg = f"MT5 connection lost during {fname}, attempting to reconnect..."
+    retry_msg = f"MT5 reconnection successful, retrying {fname}"
+    failed_msg = f"MT5 reconnection failed for {fname}"
+
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         try:
-            # Check connection before attempting operation
-            if not self.is_connected():
-                self.logger.warning(f"MT5 not connected before {func.__name__}, attempting to reconnect...")
-                if not self.connect():
-                    raise ConnectionError(f"MT5 connection failed before {func.__name__}")
-
             # First attempt
             return func(self, *args, **kwargs)
         except Exception as e:
-            # Check if it's a connection-related error
-            error_str = str(e).lower()
-            if (not self.is_connected() or
-                "not connected" in error_str or
-                "connection" in error_str or
-                isinstance(e, ConnectionError)):
+            # Drop the cached status so a stale hit cannot mask a real drop
+            self.invalidate_connection_check()
+            # Check if it's a connection-related error, cheapest test first
+            if (isinstance(e, ConnectionError) or
+                not self.is_connected() or
+                CONNECTION_ERROR_PATTERN.search(str(e))):
 
-                self.logger.warning(f"MT5 connection lost during {func.__name__}, attempting to reconnect...")
+                self.logger.warning(lost_msg)
 
                 # Attempt to reconnect
                 if self.connect():
-                    self.logger.info(f"MT5 reconnection successful, retrying {func.__name__}")
+                    self.logger.info(retry_msg)
                     # Retry the operation after successful reconnection
                     return func(self, *args, **kwargs)
                 else:
-                    self.logger.error(f"MT5 reconnection failed for {func.__name__}")
-                    raise ConnectionError(f"MT5 reconnection failed during {func.__name__}: {e}")
+                    self.logger.error(failed_msg)
+                    raise ConnectionError(f"MT5 reconnection failed during {fname}: {e}")
             else:
                 # Not a connection error, re-raise original exception
                 raise
@@ -54,6 +151,19 @@ def auto_reconnect(func):
 
 class MT5Connector:
     """Manages connection to MetaTrader 5 terminal."""
+
+    __slots__ = (
+        'config', 'logger', 'connected', 'account_info',
+        '_conn_check_ts', '_conn_check_result', '_conn_check_ttl',
+        '_server_time_symbol',
+        '_account_info_ts', '_account_info_ttl',
+        '_next_reconnect_ts', '_reconnect_backoff', '_reconnect_lock',
+    )
+
+    # The MetaTrader5 package holds one terminal session per process, so a
+    # single connector is shared process-wide, see get_shared()
+    _shared: Optional['MT5Connector'] = None
+    _shared_lock = threading.Lock()
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -66,27 +176,135 @@ class MT5Connector:
         self.logger = logging.getLogger('mt5_server.connector')
         self.connected = False
         self.account_info = None
+
+        # is_connected() result cache, avoids an account_info() round-trip
+        # for every back-to-back check within the same request
+        self._conn_check_ts = 0.0
+        self._conn_check_result = False
+        self._conn_check_ttl = config.get('connection_check_ttl', 0.5)
+
+        # Symbol whose tick get_server_time() reads
+        self._server_time_symbol = None
+
+        # Time of the last successful get_account_info(), see validate_connection()
+        self._account_info_ts = 0.0
+        self._account_info_ttl = config.get('account_info_ttl', 2.0)
+
+        # Reconnect throttling, see connect()
+        self._next_reconnect_ts = 0.0
+        self._reconnect_backoff = RECONNECT_BACKOFF_INITIAL
+        self._reconnect_lock = threading.Lock()
         
+    @classmethod
+    def get_shared(cls, config: Dict[str, Any]) -> 'MT5Connector':
+        """
+        Get the process-wide connector, connecting it if needed.
+
+        Reuses the shared connector while it is still connected, so the MT5
+        initialize handshake only runs once.
+
+        Args:
+            config: MT5 configuration dictionary
+
+        Returns:
+            Connected MT5Connector instance
+
+        Raises:
+            MT5Error: If the connection could not be established, or the
+                shared connector was created with a different configuration
+        """
+        with cls._shared_lock:
+            connector = cls._shared
+            if connector is not None and connector.config != config:
+                raise MT5Error("MT5 connector already initialized with a different configuration")
+
+            if connector is not None and connector.is_connected():
+                return connector
+
+            if connector is None:
+                connector = cls(config)
+            if not connector.connect():
+                raise MT5Error("Failed to connect to MT5 terminal")
+
+            cls._shared = connector
+            return connector
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Disconnect and drop the shared connector."""
+        with cls._shared_lock:
+            if cls._shared is not None:
+                cls._shared.disconnect()
+                cls._shared = None
+
+    @property
+    def mt5_lib(self):
+        """MetaTrader5 module, imported on first access."""
+        return load_mt5()
+
     def connect(self) -> bool:
         """
         Connect to MT5 terminal.
+
+        Attempts are serialized: callers arriving while another attempt is in
+        flight share its outcome, and callers arriving after a successful
+        attempt reuse the live session instead of initializing again. After a
+        failure further attempts are refused until an exponentially growing
+        backoff delay has passed.
         
         Returns:
             True if connection successful, False otherwise
         """
+        if not self._reconnect_lock.acquire(blocking=False):
+            # Another caller is already connecting, share its outcome
+            with self._reconnect_lock:
+                return self.connected
+
+        try:
+            # A previous attempt may have already restored the session
+            if self.connected:
+                self.invalidate_connection_check()
+                if self.is_connected():
+                    return True
+
+            now = time.monotonic()
+            if now < self._next_reconnect_ts:
+                return False
+
+            if self._initialize():
+                self._reconnect_backoff = RECONNECT_BACKOFF_INITIAL
+                self._next_reconnect_ts = 0.0
+                return True
+
+            self._next_reconnect_ts = now + self._reconnect_backoff
+            self._reconnect_backoff = min(self._reconnect_backoff * 2, RECONNECT_BACKOFF_MAX)
+            return False
+        finally:
+            self._reconnect_lock.release()
+
+    def _initialize(self) -> bool:
+        """
+        Initialize the MT5 terminal connection and load account information.
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        self._conn_check_ts = 0.0
+        self._account_info_ts = 0.0
+        self._server_time_symbol = None
         try:
             # Initialize MT5 connection
             terminal_path = self.config.get('terminal_path', '')
             if terminal_path:
-                if not mt5.initialize(path=terminal_path):
+                if not self.mt5_lib.initialize(path=terminal_path):
                     raise MT5Error(f"Failed to initialize MT5 with path: {terminal_path}")
             else:
-                result = mt5.initialize();
+                result = self.mt5_lib.initialize();
                 if not result:
                     raise MT5Error("Failed to initialize MT5")
 
             # 直接获取当前已登录账户的信息，不需要重新登录
-            self.account_info = mt5.account_info()
+            self.account_info = self.mt5_lib.account_info()
             if self.account_info is None:
                 raise MT5Error("Failed to get account information. Please ensure MT5 is logged in.")
 
@@ -98,8 +316,8 @@ class MT5Connector:
             log_mt5_connection(self.logger, "connected", login, server)
 
             # Log account details
-            self.logger.info(f"MT5 Account: {self.account_info.name} - "
-                           f"Balance: {self.account_info.balance} {self.account_info.currency}")
+            self.logger.info("MT5 Account: %s - Balance: %s %s", self.account_info.name,
+                             self.account_info.balance, self.account_info.currency)
 
             return True
             
@@ -110,9 +328,11 @@ class MT5Connector:
     
     def disconnect(self) -> None:
         """Disconnect from MT5 terminal."""
+        self._conn_check_ts = 0.0
+        self._account_info_ts = 0.0
         try:
             if self.connected:
-                mt5.shutdown()
+                self.mt5_lib.shutdown()
                 self.connected = False
                 log_mt5_connection(self.logger, "disconnected")
         except Exception as e:
@@ -127,15 +347,45 @@ class MT5Connector:
         """
         if not self.connected:
             return False
+
+        now = time.monotonic()
+        if now - self._conn_check_ts < self._conn_check_ttl:
+            return self._conn_check_result
         
         try:
             # Test connection by getting account info
-            account_info = mt5.account_info()
-            return account_info is not None
+            account_info = self.mt5_lib.account_info()
+            result = account_info is not None
         except:
             self.connected = False
-            return False
+            result = False
+
+        self._conn_check_result = result
+        self._conn_check_ts = now
+        return result
     
+    def invalidate_connection_check(self) -> None:
+        """Force the next is_connected() call to probe the terminal."""
+        self._conn_check_ts = 0.0
+
+    def validate_connection(self) -> bool:
+        """
+        Check the connection, trusting account info fetched within the TTL.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        if not self.connected:
+            return False
+
+        if time.monotonic() - self._account_info_ts < self._account_info_ttl:
+            return True
+
+        try:
+            return self.get_account_info() is not None
+        except ConnectionError:
+            return False
+
     @auto_reconnect
     def get_account_info(self) -> Optional[Dict[str, Any]]:
         """
@@ -148,11 +398,11 @@ class MT5Connector:
             if not self.is_connected():
                 raise ConnectionError("Not connected to MT5")
             
-            account_info = mt5.account_info()
+            account_info = self.mt5_lib.account_info()
             if account_info is None:
                 return None
             
-            return {
+            result = {
                 'login': account_info.login,
                 'name': account_info.name,
                 'server': account_info.server,
@@ -168,11 +418,25 @@ class MT5Connector:
                 'trade_expert': account_info.trade_expert,
                 'leverage': account_info.leverage
             }
+            self._account_info_ts = time.monotonic()
+            return result
             
+        except ConnectionError:
+            raise
         except Exception as e:
             log_error_with_context(self.logger, e, "Failed to get account info")
             return None
     
+    def get_account_record(self) -> Optional[AccountInfo]:
+        """
+        Get account information as an immutable record.
+
+        Returns:
+            AccountInfo record or None if failed
+        """
+        account_info = self.get_account_info()
+        return AccountInfo(**account_info) if account_info else None
+
     @auto_reconnect
     def get_symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -188,7 +452,7 @@ class MT5Connector:
             if not self.is_connected():
                 raise ConnectionError("Not connected to MT5")
             
-            symbol_info = mt5.symbol_info(symbol)
+            symbol_info = self.mt5_lib.symbol_info(symbol)
             if symbol_info is None:
                 return None
             
@@ -210,110 +474,160 @@ class MT5Connector:
                 'time': symbol_info.time
             }
             
+        except ConnectionError:
+            raise
         except Exception as e:
             log_error_with_context(self.logger, e, f"Failed to get symbol info for {symbol}")
             return None
     
-    @auto_reconnect
-    def get_positions(self, symbol: str = None) -> List[Dict[str, Any]]:
+    def _fetch_positions(self, symbol: str = None) -> Tuple[Any, ...]:
         """
-        Get open positions.
-        
+        Fetch raw open positions from the terminal.
+
         Args:
             symbol: Filter by symbol (optional)
-            
+
         Returns:
-            List of position dictionaries
+            Tuple of MT5 position records, empty if failed
+
+        Raises:
+            ConnectionError: If not connected, so auto_reconnect can retry
         """
         try:
             if not self.is_connected():
                 raise ConnectionError("Not connected to MT5")
             
             if symbol:
-                positions = mt5.positions_get(symbol=symbol)
+                positions = self.mt5_lib.positions_get(symbol=symbol)
             else:
-                positions = mt5.positions_get()
+                positions = self.mt5_lib.positions_get()
             
-            if positions is None:
-                return []
-            
-            result = []
-            for pos in positions:
-                result.append({
-                    'ticket': pos.ticket,
-                    'symbol': pos.symbol,
-                    'type': pos.type,
-                    'type_name': 'BUY' if pos.type == 0 else 'SELL',
-                    'volume': pos.volume,
-                    'price_open': pos.price_open,
-                    'price_current': pos.price_current,
-                    'sl': pos.sl,
-                    'tp': pos.tp,
-                    'profit': pos.profit,
-                    'swap': pos.swap,
-                    'comment': pos.comment,
-                    'magic': pos.magic,
-                    'time': pos.time,
-                    'time_update': pos.time_update,
-                    'external_id': pos.external_id,
-                    'identifier': pos.identifier,
-                    'reason': pos.reason,
-                    'time_msc': pos.time_msc,
-                    'time_update_msc': pos.time_update_msc
-                })
-            
-            return result
+            return positions or ()
             
+        except ConnectionError:
+            raise
         except Exception as e:
             log_error_with_context(self.logger, e, "Failed to get positions")
-            return []
-    
-    @auto_reconnect
-    def get_orders(self, symbol: str = None) -> List[Dict[str, Any]]:
+            return ()
+
+    def _fetch_orders(self, symbol: str = None) -> Tuple[Any, ...]:
         """
-        Get pending orders.
-        
+        Fetch raw pending orders from the terminal.
+
         Args:
             symbol: Filter by symbol (optional)
-            
+
         Returns:
-            List of order dictionaries
+            Tuple of MT5 order records, empty if failed
+
+        Raises:
+            ConnectionError: If not connected, so auto_reconnect can retry
         """
         try:
             if not self.is_connected():
                 raise ConnectionError("Not connected to MT5")
             
             if symbol:
-                orders = mt5.orders_get(symbol=symbol)
+                orders = self.mt5_lib.orders_get(symbol=symbol)
             else:
-                orders = mt5.orders_get()
+                orders = self.mt5_lib.orders_get()
             
-            if orders is None:
-                return []
-            
-            result = []
-            for order in orders:
-                result.append({
-                    'ticket': order.ticket,
-                    'symbol': order.symbol,
-                    'type': order.type,
-                    'volume_initial': order.volume_initial,
-                    'volume_current': order.volume_current,
-                    'price_open': order.price_open,
-                    'sl': order.sl,
-                    'tp': order.tp,
-                    'comment': order.comment,
-                    'magic': order.magic,
-                    'time_setup': order.time_setup,
-                    'time_expiration': order.time_expiration
-                })
-            
-            return result
+            return orders or ()
             
+        except ConnectionError:
+            raise
         except Exception as e:
             log_error_with_context(self.logger, e, "Failed to get orders")
-            return []
+            return ()
+
+    @auto_reconnect
+    def get_positions(self, symbol: str = None) -> List[Dict[str, Any]]:
+        """
+        Get open positions.
+        
+        Args:
+            symbol: Filter by symbol (optional)
+            
+        Returns:
+            List of position dictionaries
+        """
+        result = []
+        for values in map(_get_position_fields, self._fetch_positions(symbol)):
+            row = dict(zip(POSITION_FIELDS, values))
+            row['type_name'] = 'BUY' if row['type'] == 0 else 'SELL'
+            result.append(row)
+        
+        return result
+    
+    @auto_reconnect
+    def get_position_records(self, symbol: str = None) -> List[Position]:
+        """
+        Get open positions as immutable records.
+
+        Args:
+            symbol: Filter by symbol (optional)
+
+        Returns:
+            List of Position records
+        """
+        return [Position(*values) for values in map(_get_position_fields, self._fetch_positions(symbol))]
+
+    @auto_reconnect
+    def get_positions_columnar(self, symbol: str = None) -> Dict[str, np.ndarray]:
+        """
+        Get open positions as columns instead of one dictionary per position.
+
+        Args:
+            symbol: Filter by symbol (optional)
+
+        Returns:
+            Dictionary mapping each POSITION_COLUMNS field, plus 'type_name',
+            to an array with one entry per position
+        """
+        columns = _build_columns(self._fetch_positions(symbol), POSITION_COLUMNS)
+        columns['type_name'] = np.where(columns['type'] == 0, 'BUY', 'SELL')
+        return columns
+
+    @auto_reconnect
+    def get_orders(self, symbol: str = None) -> List[Dict[str, Any]]:
+        """
+        Get pending orders.
+        
+        Args:
+            symbol: Filter by symbol (optional)
+            
+        Returns:
+            List of order dictionaries
+        """
+        return [dict(zip(ORDER_FIELDS, values)) for values in map(_get_order_fields, self._fetch_orders(symbol))]
     
+    @auto_reconnect
+    def get_order_records(self, symbol: str = None) -> List[Order]:
+        """
+        Get pending orders as immutable records.
+
+        Args:
+            symbol: Filter by symbol (optional)
+
+        Returns:
+            List of Order records
+        """
+        return [Order(*values) for values in map(_get_order_fields, self._fetch_orders(symbol))]
+
+    @auto_reconnect
+    def get_orders_columnar(self, symbol: str = None) -> Dict[str, np.ndarray]:
+        """
+        Get pending orders as columns instead of one dictionary per order.
+
+        Args:
+            symbol: Filter by symbol (optional)
+
+        Returns:
+            Dictionary mapping each ORDER_COLUMNS field to an array with one
+            entry per order
+        """
+        return _build_columns(self._fetch_orders(symbol), ORDER_COLUMNS)
+
     @auto_reconnect
     def get_server_time(self) -> Optional[datetime]:
         """
@@ -324,17 +638,25 @@ class MT5Connector:
         """
         try:
             if not self.is_connected():
-                return None
-            
-            # Get latest tick to get server time
-            symbols = mt5.symbols_get()
-            if symbols and len(symbols) > 0:
-                tick = mt5.symbol_info_tick(symbols[0].name)
-                if tick:
-                    return datetime.fromtimestamp(tick.time)
+                raise ConnectionError("Not connected to MT5")
             
+            # Get latest tick to get server time, remembering which symbol
+            # to ask so the symbol list is only fetched once
+            if self._server_time_symbol is None:
+                symbols = self.mt5_lib.symbols_get()
+                if not symbols:
+                    return None
+                self._server_time_symbol = symbols[0].name
+
+            tick = self.mt5_lib.symbol_info_tick(self._server_time_symbol)
+            if tick:
+                return datetime.fromtimestamp(tick.time)
+
+            self._server_time_symbol = None
             return None
             
+        except ConnectionError:
+            raise
         except Exception as e:
             log_error_with_context(self.logger, e, "Failed to get server time")
             return None
@@ -352,15 +674,17 @@ class MT5Connector:
         """
         try:
             if not self.is_connected():
-                return False
+                raise ConnectionError("Not connected to MT5")
             
-            symbol_info = mt5.symbol_info(symbol)
+            symbol_info = self.mt5_lib.symbol_info(symbol)
             if symbol_info is None:
                 return False
             
             # Check if symbol is visible and tradeable
             return symbol_info.visible and symbol_info.trade_mode != 0
             
+        except ConnectionError:
+            raise
         except Exception as e:
             log_error_with_context(self.logger, e, f"Failed to check symbol availability for {symbol}")
             return False
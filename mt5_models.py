@@ -0,0 +1,100 @@
+"""
+Record types for MT5 Trading HTTP Server.
+Immutable rows returned by MT5Connector as an alternative to dictionaries.
+"""
+
+from typing import NamedTuple, Dict, Any
+
+
+class Position(NamedTuple):
+    """Open position."""
+
+    ticket: int
+    symbol: str
+    type: int
+    volume: float
+    price_open: float
+    price_current: float
+    sl: float
+    tp: float
+    profit: float
+    swap: float
+    comment: str
+    magic: int
+    time: int
+    time_update: int
+    external_id: str
+    identifier: int
+    reason: int
+    time_msc: int
+    time_update_msc: int
+
+    @property
+    def type_name(self) -> str:
+        """Position direction, BUY or SELL."""
+        return 'BUY' if self.type == 0 else 'SELL'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert position to the dictionary form of MT5Connector.get_positions().
+
+        Returns:
+            Position dictionary including 'type_name'
+        """
+        result = dict(self._asdict())
+        result['type_name'] = self.type_name
+        return result
+
+
+class Order(NamedTuple):
+    """Pending order."""
+
+    ticket: int
+    symbol: str
+    type: int
+    volume_initial: float
+    volume_current: float
+    price_open: float
+    sl: float
+    tp: float
+    comment: str
+    magic: int
+    time_setup: int
+    time_expiration: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert record to a dictionary.
+
+        Returns:
+            Dictionary with one entry per field
+        """
+        return dict(self._asdict())
+
+
+class AccountInfo(NamedTuple):
+    """Trading account summary."""
+
+    login: int
+    name: str
+    server: str
+    currency: str
+    balance: float
+    equity: float
+    margin: float
+    free_margin: float
+    margin_level: float
+    profit: float
+    company: str
+    trade_allowed: bool
+    trade_expert: bool
+    leverage: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert record to a dictionary.
+
+        Returns:
+            Dictionary with one entry per field
+        """
+        return dict(self._asdict())
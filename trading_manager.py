@@ -3,7 +3,6 @@ Trading Manager for MT5 Trading HTTP Server.
 Handles trade execution and management operations.
 """
 
-import MetaTrader5 as mt5
 import logging
 import re
 from typing import Dict, Any, Optional, List
@@ -13,6 +12,7 @@ from functools import wraps
 from utils.exceptions import TradingError, ValidationError, ConnectionError
 from utils.validators import validate_trade_parameters, sanitize_comment
 from utils.logger import log_trade_operation, log_error_with_context
+from mt5_connector import load_mt5, CONNECTION_ERROR_PATTERN
 
 
 def auto_reconnect_trading(func):
@@ -31,12 +31,12 @@ def auto_reconnect_trading(func):
             # First attempt
             return func(self, *args, **kwargs)
         except Exception as e:
-            # Check if it's a connection-related error
-            error_str = str(e).lower()
-            if (not self.mt5_connector.is_connected() or
-                "not connected" in error_str or
-                "connection" in error_str or
-                isinstance(e, ConnectionError)):
+            # Drop the cached status so a stale hit cannot mask a real drop
+            self.mt5_connector.invalidate_connection_check()
+            # Check if it's a connection-related error, cheapest test first
+            if (isinstance(e, ConnectionError) or
+                not self.mt5_connector.is_connected() or
+                CONNECTION_ERROR_PATTERN.search(str(e))):
 
                 self.logger.warning(f"MT5 connection lost during {func.__name__}, attempting to reconnect...")
 
@@ -231,6 +231,7 @@ class TradingManager:
         Returns:
             Order execution result
         """
+        mt5 = load_mt5()
         action = payload['action'].lower()
         symbol = payload['symbol'].upper()
         volume = payload.get('volume', self.config.get('default_volume', 0.1))
@@ -341,6 +342,7 @@ class TradingManager:
         Returns:
             Close operation result
         """
+        mt5 = load_mt5()
         symbol = payload['symbol'].upper()
         ticket = payload.get('ticket')
         volume = payload.get('volume')  # Partial close volume
@@ -506,6 +508,7 @@ class TradingManager:
         Returns:
             Modify operation result
         """
+        mt5 = load_mt5()
         symbol = payload['symbol'].upper()
         ticket = payload.get('ticket')
         new_sl = payload.get('sl') or payload.get('stop_loss')
@@ -563,6 +566,7 @@ class TradingManager:
         Returns:
             Appropriate filling mode constant
         """
+        mt5 = load_mt5()
         try:
             filling_mode_flags = symbol_info.filling_mode
 
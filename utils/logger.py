@@ -75,6 +75,9 @@ def log_trade_operation(logger: logging.Logger, operation: str, symbol: str,
         price: Trade price (optional)
         result: Operation result (optional)
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     message = f"TRADE: {operation.upper()} {volume} {symbol}"
     if price:
         message += f" @ {price}"
@@ -114,6 +117,9 @@ def log_mt5_connection(logger: logging.Logger, status: str, account: int = None,
         account: MT5 account number (optional)
         server: MT5 server name (optional)
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     message = f"MT5: {status.upper()}"
     if account:
         message += f" - Account: {account}"
@@ -8,6 +8,17 @@ from typing import Dict, Any, List, Optional
 from flask import Request
 from utils.exceptions import ValidationError
 
+# Supported trade actions
+VALID_ACTIONS = ['buy', 'sell', 'close', 'close_all', 'modify']
+_VALID_ACTION_SET = frozenset(VALID_ACTIONS)
+_VALID_ACTIONS_HINT = f"Must be one of {VALID_ACTIONS}"
+
+# Payload fields that carry a price
+PRICE_FIELDS = ('price', 'sl', 'tp', 'stop_loss', 'take_profit')
+
+# Allows alphanumeric characters, dots, underscores, and hyphens
+SYMBOL_PATTERN = re.compile(r'^[A-Z0-9._-]+$')
+
 
 def validate_api_key(request: Request, security_config: Dict[str, Any]) -> bool:
     """
@@ -96,7 +107,6 @@ def validate_webhook_payload(payload: Dict[str, Any], webhook_config: Dict[str,
     
     try:
         # Check required fields based on action type
-        action = payload.get('action', '').lower()
         required_fields = webhook_config.get('required_fields', [])
 
         for field in required_fields:
@@ -107,13 +117,12 @@ def validate_webhook_payload(payload: Dict[str, Any], webhook_config: Dict[str,
         
         # Validate action field
         if 'action' in payload:
-            action = payload['action'].lower()
-            valid_actions = [
-                'buy', 'sell', 'close', 'close_all', 'modify'
-            ]
-            if action not in valid_actions:
+            action = payload['action']
+            if action not in _VALID_ACTION_SET:
+                action = action.lower()
+            if action not in _VALID_ACTION_SET:
                 result['valid'] = False
-                result['message'] = f"Invalid action: {action}. Must be one of {valid_actions}"
+                result['message'] = f"Invalid action: {action}. {_VALID_ACTIONS_HINT}"
                 return result
         
         # Validate symbol field
@@ -125,7 +134,7 @@ def validate_webhook_payload(payload: Dict[str, Any], webhook_config: Dict[str,
                 return result
             
             # Check symbol format (basic validation)
-            if not re.match(r'^[A-Z0-9._-]+$', symbol.upper()):
+            if not SYMBOL_PATTERN.match(symbol.upper()):
                 result['valid'] = False
                 result['message'] = f"Invalid symbol format: {symbol}"
                 return result
@@ -139,8 +148,7 @@ def validate_webhook_payload(payload: Dict[str, Any], webhook_config: Dict[str,
                 return result
         
         # Validate price fields
-        price_fields = ['price', 'sl', 'tp', 'stop_loss', 'take_profit']
-        for field in price_fields:
+        for field in PRICE_FIELDS:
             if field in payload:
                 price = payload[field]
                 if price is not None and (not isinstance(price, (int, float)) or price < 0):
@@ -208,8 +216,7 @@ def validate_trade_parameters(symbol: str, volume: float, action: str,
         raise ValidationError(f"Symbol {symbol} is not in allowed symbols list")
     
     # Validate action
-    valid_actions = ['buy', 'sell', 'close', 'close_all', 'modify']
-    if action.lower() not in valid_actions:
+    if action not in _VALID_ACTION_SET and action.lower() not in _VALID_ACTION_SET:
         raise ValidationError(f"Invalid action: {action}")
 
 
@@ -227,9 +234,7 @@ def validate_symbol_format(symbol: str) -> bool:
         return False
     
     # Basic symbol format validation
-    # Allows alphanumeric characters, dots, underscores, and hyphens
-    pattern = r'^[A-Z0-9._-]+$'
-    return bool(re.match(pattern, symbol.upper()))
+    return bool(SYMBOL_PATTERN.match(symbol.upper()))
 
 
 def sanitize_comment(comment: str) -> str: